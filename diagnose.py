@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Environment diagnostics for the SWE-bench runner.
+Checks that the backend CLIs, Docker, and required Python packages are available.
+"""
+
+import importlib.util
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# (command, display label) pairs probed on startup
+REQUIRED_COMMANDS = [
+    ("python3", "Python"),
+    ("claude", "Claude CLI"),
+    ("codex", "Codex CLI"),
+    ("gemini", "Gemini CLI"),
+    ("cline", "Cline CLI"),
+    ("docker", "Docker"),
+]
+
+# Core packages the benchmark scripts import at startup
+REQUIRED_PACKAGES = ["datasets", "tqdm", "jsonlines"]
+
+
+def check_command(cmd, label):
+    """Probe a single CLI and return a result dict (printing happens later).
+
+    Returning data instead of printing keeps output ordered when probes
+    run concurrently.
+    """
+    # A PATH lookup answers "is it installed?" without forking the binary -
+    # for the Node.js CLIs that avoids a 200-500ms runtime cold start just
+    # to discover the command is missing.
+    if shutil.which(cmd) is None:
+        return {"label": label, "ok": False, "detail": "not found"}
+
+    # Cline uses 'cline version' rather than the conventional --version flag
+    version_arg = "version" if cmd == "cline" else "--version"
+    try:
+        result = subprocess.run(
+            [cmd, version_arg],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode != 0:
+            return {"label": label, "ok": False, "detail": "probe failed"}
+        first_line = result.stdout.strip().splitlines()
+        return {"label": label, "ok": True, "detail": first_line[0] if first_line else ""}
+    except FileNotFoundError:
+        return {"label": label, "ok": False, "detail": "not found"}
+    except subprocess.TimeoutExpired:
+        return {"label": label, "ok": False, "detail": "timed out"}
+
+
+def check_python_packages(packages=None):
+    """Check that required Python packages are installed.
+
+    Uses find_spec rather than importing: answering "is it installed?"
+    does not require executing the package (importing datasets alone
+    pulls in pyarrow and huggingface_hub - hundreds of ms and tens of MB
+    just for a presence check).
+    """
+    results = []
+    for package in packages or REQUIRED_PACKAGES:
+        if importlib.util.find_spec(package) is not None:
+            results.append({"label": package, "ok": True, "detail": ""})
+        else:
+            results.append({"label": package, "ok": False, "detail": "not installed"})
+    return results
+
+
+def main():
+    print("=" * 60)
+    print("SWE-bench Environment Diagnostics")
+    print("=" * 60)
+
+    # Probe all CLIs concurrently - each probe is dominated by process
+    # startup (and a 5s timeout on failure), so total wall time is the
+    # slowest probe instead of the sum of all of them.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        command_results = list(
+            executor.map(lambda probe: check_command(*probe), REQUIRED_COMMANDS)
+        )
+
+    print("\nCommands:")
+    for result in command_results:
+        marker = "✅" if result["ok"] else "❌"
+        detail = f" ({result['detail']})" if result["detail"] else ""
+        print(f"  {marker} {result['label']}{detail}")
+
+    print("\nPython packages:")
+    package_results = check_python_packages()
+    for result in package_results:
+        marker = "✅" if result["ok"] else "❌"
+        detail = f" ({result['detail']})" if result["detail"] else ""
+        print(f"  {marker} {result['label']}{detail}")
+
+    failures = [r for r in command_results + package_results if not r["ok"]]
+    if failures:
+        print(f"\n⚠️  {len(failures)} check(s) failed")
+        return 1
+
+    print("\nAll checks passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
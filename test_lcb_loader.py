@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Quick smoke test for the LongCodeBench loader.
+
+Usage:
+    python test_lcb_loader.py [dataset_name] [split] [context_length]
+"""
+
+import itertools
+import sys
+
+from utils.longcodebench_loader import (
+    extract_context_length,
+    is_longcodebench_dataset,
+    load_longcodebench_dataset,
+)
+
+
+def test_loader(dataset_name, split="test", context_length=None):
+    print(f"Dataset: {dataset_name}")
+    print(f"LongCodeBench dataset: {is_longcodebench_dataset(dataset_name)}")
+
+    if context_length is None:
+        context_length = extract_context_length(dataset_name)
+    print(f"Context length: {context_length}")
+
+    dataset = load_longcodebench_dataset(dataset_name, split, context_length)
+    print(f"Loaded {len(dataset)} instances")
+    # column_names is a plain attribute; going through dataset.features
+    # materializes the full Arrow schema just to throw most of it away
+    print(f"Features: {dataset.column_names[:10]}")
+
+    first = dataset[0]
+    print(f"First instance keys: {list(itertools.islice(first.keys(), 10))}")
+    return dataset
+
+
+def main():
+    dataset_name = sys.argv[1] if len(sys.argv) > 1 else "Steefano/LCB"
+    split = sys.argv[2] if len(sys.argv) > 2 else "test"
+    context_length = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    test_loader(dataset_name, split, context_length)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
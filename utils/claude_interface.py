@@ -1,4 +1,3 @@
-import os
 import json
 import subprocess
 from typing import Dict, List, Optional
@@ -33,12 +32,6 @@ class ClaudeCodeInterface:
             model: Optional model to use (e.g., 'opus-4.1', 'sonnet-3.7').
         """
         try:
-            # Save the current directory
-            original_cwd = os.getcwd()
-
-            # Change to the working directory
-            os.chdir(cwd)
-
             # Build command with optional model parameter
             cmd = ["claude", "--dangerously-skip-permissions"]
             if model:
@@ -48,14 +41,12 @@ class ClaudeCodeInterface:
             result = subprocess.run(
                 cmd,
                 input=prompt,
+                cwd=cwd,
                 capture_output=True,
                 text=True,
                 timeout=600,  # 10 minute timeout
             )
 
-            # Restore original directory
-            os.chdir(original_cwd)
-
             return {
                 "success": result.returncode == 0,
                 "stdout": result.stdout,
@@ -64,7 +55,6 @@ class ClaudeCodeInterface:
             }
 
         except subprocess.TimeoutExpired:
-            os.chdir(original_cwd)
             return {
                 "success": False,
                 "stdout": "",
@@ -72,7 +62,6 @@ class ClaudeCodeInterface:
                 "returncode": -1,
             }
         except Exception as e:
-            os.chdir(original_cwd)
             return {
                 "success": False,
                 "stdout": "",
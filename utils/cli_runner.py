@@ -0,0 +1,50 @@
+"""
+Shared subprocess helper that streams CLI output to temporary files.
+
+subprocess.run(capture_output=True) buffers the entire child output in
+memory; long Codex/Cline agent sessions can emit tens of megabytes of trace
+text, and with several concurrent workers that buffering dominates memory
+use. Streaming to unlinked temp files keeps resident memory bounded while
+the child runs; output is read back and decoded once on completion.
+"""
+
+import subprocess
+import tempfile
+from typing import Dict, List, Optional
+
+
+def run_cli_streaming(cmd: List[str], cwd: str, timeout: int,
+                      input_bytes: Optional[bytes] = None) -> Dict:
+    """Run a CLI command with stdout/stderr spooled to disk.
+
+    Returns the standard interface result dict. On timeout the child is
+    killed and subprocess.TimeoutExpired is raised with whatever partial
+    output was captured attached, matching subprocess.run semantics.
+    """
+    with tempfile.TemporaryFile() as out_file, tempfile.TemporaryFile() as err_file:
+        process = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdin=subprocess.PIPE if input_bytes is not None else None,
+            stdout=out_file,
+            stderr=err_file,
+        )
+        try:
+            process.communicate(input=input_bytes, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            out_file.seek(0)
+            err_file.seek(0)
+            raise subprocess.TimeoutExpired(
+                cmd, timeout, output=out_file.read(), stderr=err_file.read()
+            )
+
+        out_file.seek(0)
+        err_file.seek(0)
+        return {
+            "success": process.returncode == 0,
+            "stdout": out_file.read().decode("utf-8", errors="replace"),
+            "stderr": err_file.read().decode("utf-8", errors="replace"),
+            "returncode": process.returncode,
+        }
@@ -1,22 +1,50 @@
-import os
+import shutil
 import subprocess
 from typing import Dict, List
 
+from .cli_runner import run_cli_streaming
+
+# Base invocation shared by every task:
+# -y: auto-confirm
+# -F plain: plain text output format
+# --oneshot: execute task once without interactive mode (suitable for automation)
+_CLINE_BASE_CMD = ("cline", "-y", "-F", "plain", "--oneshot")
+
+# Cline receives the prompt as a positional argument, and Linux caps a single
+# argv string well below ARG_MAX (~128KB). An oversized prompt would only fail
+# inside execve, after the fork - so reject it before spawning anything.
+_MAX_PROMPT_ARGV_BYTES = 100_000
+
 class ClineCodeInterface:
     """Interface for interacting with the Cline CLI."""
 
-    def __init__(self):
-        """Ensure the Cline CLI is available on the system."""
-        try:
-            result = subprocess.run(["cline", "version"], capture_output=True, text=True)
-            if result.returncode != 0:
-                raise RuntimeError(
-                    "Cline CLI not found. Please ensure 'cline' is installed and in PATH"
-                )
-        except FileNotFoundError:
+    # Set once the CLI has been verified, so batch runs that build one
+    # interface per instance only pay for the version probe once.
+    _cli_checked = False
+
+    def __init__(self, timeout_s: int = 1800):
+        """Ensure the Cline CLI is available on the system.
+
+        Args:
+            timeout_s: Seconds to wait for a single Cline task before
+                giving up. Defaults to 30 minutes - Cline may need more
+                time than the other backends for complex tasks.
+        """
+        self.timeout_s = timeout_s
+        if ClineCodeInterface._cli_checked:
+            return
+
+        if shutil.which("cline") is None:
+            raise RuntimeError(
+                "Cline CLI not found. Please ensure 'cline' is installed and in PATH"
+            )
+
+        result = subprocess.run(["cline", "version"], capture_output=True, text=True)
+        if result.returncode != 0:
             raise RuntimeError(
                 "Cline CLI not found. Please ensure 'cline' is installed and in PATH"
             )
+        ClineCodeInterface._cli_checked = True
 
     def execute_code_cli(self, prompt: str, cwd: str, model: str = None) -> Dict[str, any]:
         """Execute Cline via CLI and capture the response.
@@ -29,16 +57,22 @@ class ClineCodeInterface:
                    Models must be configured via 'cline auth' command.
                    This parameter is kept for API compatibility but has no effect.
         """
+        prompt_size = len(prompt.encode("utf-8"))
+        if prompt_size > _MAX_PROMPT_ARGV_BYTES:
+            return {
+                "success": False,
+                "stdout": "",
+                "stderr": (
+                    f"Prompt too large to pass as a CLI argument: "
+                    f"{prompt_size} bytes (limit {_MAX_PROMPT_ARGV_BYTES})"
+                ),
+                "returncode": -1,
+            }
+
         try:
-            original_cwd = os.getcwd()
-            os.chdir(cwd)
-
-            # Build command with proper Cline CLI syntax
-            # -y: auto-confirm
-            # -F plain: plain text output format
-            # --oneshot: execute task once without interactive mode (suitable for automation)
-            cmd = ["cline", "-y", "-F", "plain", "--oneshot"]
-            
+            cmd = [*_CLINE_BASE_CMD]
+
+
             # Note: Cline does not support setting model via -s model= task setting.
             # The error "unsupported field 'model'" occurs if we try to use it.
             # Models must be configured via 'cline auth' command (e.g., cline auth -p openai-native -k KEY -m gpt-5).
@@ -50,27 +84,15 @@ class ClineCodeInterface:
             # Prompt is passed as positional argument (not via stdin)
             cmd.append(prompt)
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=1800,  # 30 minutes - Cline may need more time for complex tasks
-            )
-
-            os.chdir(original_cwd)
-            return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode,
-            }
+            # Stream output to disk - agent traces can be tens of megabytes
+            # and buffering them in memory adds up across workers.
+            return run_cli_streaming(cmd, cwd=cwd, timeout=self.timeout_s)
         except subprocess.TimeoutExpired as e:
-            os.chdir(original_cwd)
             # Try to get partial output if available
-            partial_stdout = getattr(e, 'stdout', '') or ''
-            partial_stderr = getattr(e, 'stderr', '') or ''
+            partial_stdout = (getattr(e, 'stdout', None) or b'').decode("utf-8", errors="replace")
+            partial_stderr = (getattr(e, 'stderr', None) or b'').decode("utf-8", errors="replace")
             
-            timeout_msg = "Command timed out after 30 minutes"
+            timeout_msg = f"Command timed out after {self.timeout_s} seconds"
             if partial_stdout or partial_stderr:
                 timeout_msg += f". Partial output - stdout: {len(partial_stdout)} chars, stderr: {len(partial_stderr)} chars"
             
@@ -81,7 +103,6 @@ class ClineCodeInterface:
                 "returncode": -1,
             }
         except Exception as e:
-            os.chdir(original_cwd)
             return {
                 "success": False,
                 "stdout": "",
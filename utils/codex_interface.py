@@ -1,47 +1,48 @@
-import os
+import shutil
 import subprocess
 from typing import Dict, List
 
+from .cli_runner import run_cli_streaming
+
+# Base invocation shared by every task
+_CODEX_EXEC_BASE_CMD = ("codex", "exec", "--full-auto")
+
 class CodexCodeInterface:
     """Interface for interacting with the Codex CLI."""
 
+    # Set once the CLI has been verified, so batch runs that build one
+    # interface per instance only pay for the version probe once.
+    _cli_checked = False
+
     def __init__(self):
         """Ensure the Codex CLI is available on the system."""
-        try:
-            result = subprocess.run(["codex", "--version"], capture_output=True, text=True)
-            if result.returncode != 0:
-                raise RuntimeError(
-                    "Codex CLI not found. Please ensure 'codex' is installed and in PATH"
-                )
-        except FileNotFoundError:
+        if CodexCodeInterface._cli_checked:
+            return
+
+        if shutil.which("codex") is None:
             raise RuntimeError(
                 "Codex CLI not found. Please ensure 'codex' is installed and in PATH"
             )
 
+        result = subprocess.run(["codex", "--version"], capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(
+                "Codex CLI not found. Please ensure 'codex' is installed and in PATH"
+            )
+        CodexCodeInterface._cli_checked = True
+
     def execute_code_cli(self, prompt: str, cwd: str, model: str = None) -> Dict[str, any]:
         """Execute Codex via CLI and capture the response."""
         try:
-            original_cwd = os.getcwd()
-            os.chdir(cwd)
-            cmd = ["codex", "exec", "--full-auto"]
+            cmd = [*_CODEX_EXEC_BASE_CMD]
             if model:
                 cmd.extend(["--model", model])
-            result = subprocess.run(
-                cmd,
-                input=prompt,
-                capture_output=True,
-                text=True,
-                timeout=600,
+            # Stream output to disk - agent traces can be tens of megabytes
+            # and buffering them in memory adds up across workers.
+            return run_cli_streaming(
+                cmd, cwd=cwd, timeout=600, input_bytes=prompt.encode("utf-8")
             )
-            os.chdir(original_cwd)
-            return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode,
-            }
         except subprocess.TimeoutExpired:
-            os.chdir(original_cwd)
             return {
                 "success": False,
                 "stdout": "",
@@ -49,7 +50,6 @@ class CodexCodeInterface:
                 "returncode": -1,
             }
         except Exception as e:
-            os.chdir(original_cwd)
             return {
                 "success": False,
                 "stdout": "",
@@ -1,4 +1,3 @@
-import os
 import subprocess
 from typing import Dict, List
 
@@ -27,9 +26,6 @@ class GeminiCodeInterface:
             model: Optional model to use.
         """
         try:
-            original_cwd = os.getcwd()
-            os.chdir(cwd)
-
             # Build command
             cmd = ["gemini"]
             if model:
@@ -39,13 +35,12 @@ class GeminiCodeInterface:
             result = subprocess.run(
                 cmd,
                 input=prompt,
+                cwd=cwd,
                 capture_output=True,
                 text=True,
                 timeout=600,  # 10 minute timeout
             )
 
-            os.chdir(original_cwd)
-
             return {
                 "success": result.returncode == 0,
                 "stdout": result.stdout,
@@ -54,7 +49,6 @@ class GeminiCodeInterface:
             }
 
         except subprocess.TimeoutExpired:
-            os.chdir(original_cwd)
             return {
                 "success": False,
                 "stdout": "",
@@ -62,7 +56,6 @@ class GeminiCodeInterface:
                 "returncode": -1,
             }
         except Exception as e:
-            os.chdir(original_cwd)
             return {
                 "success": False,
                 "stdout": "",
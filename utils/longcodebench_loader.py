@@ -0,0 +1,286 @@
+"""
+LongCodeBench (LCB) dataset support.
+
+Detects LongCodeBench-style dataset names, loads the dataset either from the
+HuggingFace hub or from a locally cached LongSWE_Bench.zip archive, and
+enriches instances with any context files they carry.
+"""
+
+import atexit
+import bisect
+import hashlib
+import json
+import re
+import shutil
+import tempfile
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# orjson parses severalfold faster than stdlib json; fall back silently
+# when it is not installed (both raise ValueError subclasses on bad input)
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Upper bound (inclusive) of each context-length bucket in the zip layout;
+# anything above the last bound falls into the 1M bucket
+_CTX_BOUNDS = (32000, 64000, 128000, 256000, 512000)
+_CTX_LABELS = ('32K', '64K', '128K', '256K', '512K', '1M')
+
+# Precompiled once at import, with the alternatives fused into a single
+# pattern so each check is one regex scan instead of one per alternative.
+_LCB_COMBINED = re.compile(
+    r'longcodebench|long-code-bench|\blcb\b|swebench.*tuned|swebench.*k\d+',
+    re.IGNORECASE,
+)
+
+# Group 1/2: explicit token count; group 3: trailing 'k' means thousands of
+# tokens (e.g. '128k' -> 128000)
+_CTX_LEN_COMBINED = re.compile(r'k-?(\d+)|context-?(\d+)|(\d+)k', re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def is_longcodebench_dataset(dataset_name: str) -> bool:
+    """Check whether a dataset name refers to a LongCodeBench dataset.
+
+    A pure string predicate, so results are cached - callers check the
+    same dataset name repeatedly during a run.
+    """
+    # The lowered copy only feeds the substring gate; the memoization above
+    # means it is allocated once per distinct name, not per call
+    dataset_lower = dataset_name.lower()
+    # Cheap substring gate: most names are not LCB-like, and C-level
+    # str.__contains__ rejects them far faster than the regex engine
+    if not any(s in dataset_lower for s in ('lcb', 'longcode', 'long-code', 'swebench')):
+        return False
+    return _LCB_COMBINED.search(dataset_name) is not None
+
+
+def extract_context_length(dataset_name: str) -> Optional[int]:
+    """Extract a context length (in tokens) from a dataset name, if present."""
+    # No digits means no context-length pattern can possibly match
+    if not any(ch.isdigit() for ch in dataset_name):
+        return None
+    match = _CTX_LEN_COMBINED.search(dataset_name)
+    if not match:
+        return None
+    explicit = match.group(1) or match.group(2)
+    if explicit:
+        return int(explicit)
+    return int(match.group(3)) * 1000
+
+
+# Fields an instance may carry its context files in, in priority order
+_CONTEXT_FIELDS = ('context_files', 'context', 'relevant_files', 'file_contents', 'files')
+
+
+def _extract_context_files(instance: Dict):
+    """Scan the known context fields once, returning (files, found).
+
+    Shared by the presence check and the accessor so callers needing both
+    answers do not walk the field list (and hash every key) twice.
+    """
+    for field in _CONTEXT_FIELDS:
+        # One hash lookup per field - 'in' followed by [] would do two
+        files = instance.get(field)
+        if files:
+            if isinstance(files, list):
+                return files, True
+            if isinstance(files, str):
+                try:
+                    return _loads(files), True
+                except (ValueError, TypeError):
+                    # Fall back to one file path per line
+                    return [line.strip() for line in files.split('\n') if line.strip()], True
+    return [], False
+
+
+def has_context_files(instance: Dict) -> bool:
+    """Check whether an instance carries context files in any known field."""
+    return any(instance.get(field) for field in _CONTEXT_FIELDS)
+
+
+def get_context_files(instance: Dict) -> List:
+    """Return the context files attached to an instance, normalized to a list."""
+    return _extract_context_files(instance)[0]
+
+
+def enrich_instance_with_context(instance: Dict, repo_path: Optional[str] = None,
+                                 inplace: bool = False) -> Dict:
+    """Annotate an instance with its context files.
+
+    Returns a copy by default; pass inplace=True to update the instance
+    dict itself, which skips the per-row copy of every field when
+    enriching a whole dataset in a streaming loop.
+    """
+    enriched = instance if inplace else instance.copy()
+    files, found = _extract_context_files(instance)
+    enriched['context_files'] = files
+    enriched['has_context'] = found
+    return enriched
+
+
+@lru_cache(maxsize=4)
+def _open_zip(path_str: str):
+    """Open an archive once per process and parse its central directory.
+
+    LongSWE_Bench.zip holds thousands of entries across all context
+    lengths and splits; sweeps over several (context length, split) pairs
+    reuse the open handle and its (context length, split) -> members
+    layout instead of re-parsing the central directory per call. The
+    handle stays open for the process lifetime and is closed at exit.
+    """
+    zf = zipfile.ZipFile(path_str, 'r')
+    atexit.register(zf.close)
+    # Walk the central directory once, bucketing members by
+    # (context length, split); every later lookup is then O(1) instead
+    # of another full scan of the member list
+    layout = {}
+    for info in zf.infolist():
+        parts = info.filename.split('/', 3)
+        if len(parts) >= 3 and parts[0] == 'LongSWE_Bench' and parts[2]:
+            layout.setdefault((parts[1], parts[2]), []).append(info)
+    return zf, layout
+
+
+def _dataset_from_arrow_files(arrow_files: List[str]):
+    """Memory-map cached Arrow files directly into a Dataset.
+
+    Dataset.from_file mmaps each file zero-copy; going through
+    load_dataset('arrow', ...) would push the same data through the Arrow
+    builder again and write a second copy into the HF cache.
+    """
+    from datasets import Dataset, concatenate_datasets
+
+    parts = [Dataset.from_file(path) for path in arrow_files]
+    return parts[0] if len(parts) == 1 else concatenate_datasets(parts)
+
+
+@lru_cache(maxsize=8)
+def load_longcodebench_from_zip(dataset_name: str, split: str = 'test',
+                                context_length: Optional[int] = None):
+    """Load a LongCodeBench split from a locally cached LongSWE_Bench.zip.
+
+    The archive lays out Arrow files as LongSWE_Bench/<context length>/<split>/.
+    """
+    lcb_dir = Path.home() / '.cache' / 'huggingface'
+    # rglob is a generator - taking only the first hit stops the recursive
+    # walk there instead of stat'ing the rest of the HF cache tree
+    zip_file = next(lcb_dir.rglob('LongSWE_Bench.zip'), None)
+    if zip_file is None:
+        raise FileNotFoundError(f"LongSWE_Bench.zip not found under {lcb_dir}")
+
+    if context_length is None:
+        context_length = 128000
+
+    context_length_str = _CTX_LABELS[bisect.bisect_left(_CTX_BOUNDS, context_length)]
+
+    # Extracted Arrow data is kept in a stable per-archive cache directory:
+    # the loaded dataset memory-maps these files, so they must outlive this
+    # call, and later calls (or processes) skip re-extraction entirely.
+    cache_base = (Path.home() / '.cache' / 'longcodebench'
+                  / hashlib.sha1(str(zip_file).encode()).hexdigest()[:12]
+                  / context_length_str)
+
+    cached = sorted(str(p) for p in (cache_base / split).glob('*.arrow'))
+    if cached:
+        return _dataset_from_arrow_files(cached)
+
+    z, layout = _open_zip(str(zip_file))
+
+    available_splits = {s for ctx, s in layout if ctx == context_length_str}
+
+    if not available_splits:
+        # layout was built in one pass; report the distinct context
+        # lengths from its keys instead of rescanning the member list
+        available = {ctx for ctx, _ in layout}
+        raise ValueError(
+            f"Context length {context_length_str} not found in {zip_file}. "
+            f"Available context lengths: {sorted(available)}"
+        )
+
+    if split in available_splits:
+        actual_split = split
+    elif 'test' in available_splits:
+        actual_split = 'test'
+    else:
+        actual_split = sorted(available_splits)[0]
+
+    cache_dir = cache_base / actual_split
+    arrow_files = sorted(str(p) for p in cache_dir.glob('*.arrow'))
+    if arrow_files:
+        return _dataset_from_arrow_files(arrow_files)
+
+    files_to_extract = [
+        info for info in layout.get((context_length_str, actual_split), [])
+        if info.filename.endswith('.arrow')
+    ]
+
+    if not files_to_extract:
+        raise ValueError(
+            f"No Arrow files for context length {context_length_str} "
+            f"split {actual_split} in {zip_file}"
+        )
+
+    # Extract into a staging directory next to the cache and rename it
+    # into place, so concurrent processes either see a complete cache
+    # directory or none at all (first writer wins)
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix='.staging-', dir=cache_dir.parent))
+    try:
+        for info in files_to_extract:
+            z.extract(info, staging)
+        extracted = staging / 'LongSWE_Bench' / context_length_str / actual_split
+        try:
+            extracted.rename(cache_dir)
+        except OSError:
+            # Another process populated the cache first; use its copy
+            pass
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    arrow_files = sorted(str(p) for p in cache_dir.glob('*.arrow'))
+    return _dataset_from_arrow_files(arrow_files)
+
+
+@lru_cache(maxsize=8)
+def load_longcodebench_dataset(dataset_name: str, split: str = 'test',
+                               context_length: Optional[int] = None):
+    """Load a LongCodeBench dataset, falling back to the local zip archive.
+
+    Results are cached per (dataset_name, split, context_length) so eval
+    loops that reload the same dataset reuse the materialized object
+    instead of repeating the hub download or zip extraction.
+    """
+    import numpy as np
+    from datasets import load_dataset
+
+    if context_length is None:
+        context_length = extract_context_length(dataset_name)
+
+    try:
+        dataset = load_dataset(dataset_name, split=split)
+        if context_length is not None and 'k' in dataset.column_names:
+            # select() with precomputed indices returns a view backed by an
+            # indices buffer over the original Arrow table, where filter()
+            # would rematerialize the whole table
+            indices = np.flatnonzero(np.asarray(dataset['k']) == context_length)
+            dataset = dataset.select(indices)
+        return dataset
+    except Exception as e:
+        # The zip fallback only makes sense for LongCodeBench-style names;
+        # for anything else the hub error is the real story, so let it
+        # propagate untouched
+        if not is_longcodebench_dataset(dataset_name):
+            raise
+        print(f"Failed to load {dataset_name} from the hub: {e}")
+        try:
+            return load_longcodebench_from_zip(dataset_name, split, context_length)
+        except (ValueError, FileNotFoundError, zipfile.BadZipFile) as zip_error:
+            raise ValueError(
+                f"Could not load LongCodeBench dataset {dataset_name}"
+            ) from zip_error